@@ -1,10 +1,12 @@
 import asyncio
-import json
+import functools
 import secrets
-import string
 import os
 
-from eth_keys import keys
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 from indy_besu_vdr import *
 
 # Account address to use for sending transactions
@@ -17,19 +19,59 @@ identity = {
     "secret": '7eda33eb6a38a8e231ea5c3de90df24b8982e4de94ef0e3f870d8ca386a63132'
 }
 network = 'test'
+schema_attr_names = ("First Name", "Last Name")
 project_root = f"{os.getcwd()}/../../.."
 
 
-def sign(secret: str, data: bytes):
-    signature = keys.PrivateKey(bytearray.fromhex(secret)).sign_msg_hash(data)
-    rec_id = int(signature[-1:][0])
-    sig = signature[0:-1]
-    return SignatureData(rec_id, sig)
+class Signer:
+    def __init__(self, secret: str):
+        # imported lazily so that the demo does not pay for loading the crypto backend until keys are needed
+        import coincurve
+        self._private_key = coincurve.PrivateKey(bytes.fromhex(secret))
 
+    def sign(self, data: bytes) -> SignatureData:
+        # `data` is already a keccak hash so it must be signed as is
+        signature = self._private_key.sign_recoverable(data, hasher=None)
+        return SignatureData(signature[64], signature[:64])
 
+
+@functools.lru_cache(maxsize=16)
+def get_signer(secret: str) -> Signer:
+    # keys looked up by secret on every use are decoded only once
+    return Signer(secret)
+
+
+@functools.lru_cache()
 def read_config():
-    with open(f"{project_root}/network/config.json") as f:
-        return json.loads(f.read())
+    with open(f"{project_root}/network/config.json", "rb") as f:
+        return json_loads(f.read())
+
+
+async def build_did_transaction(client: LedgerClient, identity_signer: Signer, did: str) -> Transaction:
+    service_attribute = {"serviceEndpoint": "http://10.0.0.2", "type": "TestService"}
+    endorsing_data = await DidEthrRegistry.build_did_set_attribute_endorsing_data(client, did, service_attribute, 1000)
+    identity_signature = identity_signer.sign(endorsing_data.get_signing_bytes())
+    endorsing_data.set_signature(identity_signature)
+    return await Endorsement.build_endorsement_transaction(client, trustee["address"], endorsing_data)
+
+
+async def build_schema_transaction(client: LedgerClient, identity_signer: Signer, schema: Schema) -> Transaction:
+    endorsing_data = await SchemaRegistry.build_create_schema_endorsing_data(client, schema)
+    identity_signature = identity_signer.sign(endorsing_data.get_signing_bytes())
+    endorsing_data.set_signature(identity_signature)
+
+    # Author: serialize endorsement data into JSON string and pass it to trustee
+    endorsing_data_json = endorsing_data.to_string()
+    print('  Schema transaction endorsement data: ' + endorsing_data_json)
+    # Trustee: deserialize endorsement data form json
+    schema_endorsing_data = TransactionEndorsingData.from_string(endorsing_data_json)
+    return await Endorsement.build_endorsement_transaction(client, trustee["address"], schema_endorsing_data)
+
+
+async def submit_transaction(client: LedgerClient, trustee_signer: Signer, transaction: Transaction) -> bytes:
+    trustee_signature = trustee_signer.sign(transaction.get_signing_bytes())
+    transaction.set_signature(trustee_signature)
+    return await client.submit_transaction(transaction)
 
 
 async def demo():
@@ -52,48 +94,48 @@ async def demo():
     status = await client.ping()
     print(' Status: ' + str(status))
 
-    print("2. Publish DID")
+    print("2. Publish DID and Schema")
+    trustee_signer = get_signer(trustee["secret"])
+    identity_signer = get_signer(identity["secret"])
     did = 'did:ethr:' + identity['address']
-    service_attribute = {"serviceEndpoint": "http://10.0.0.2", "type": "TestService"}
-    endorsing_data = await DidEthrRegistry.build_did_set_attribute_endorsing_data(client, did, service_attribute, 1000)
-    identity_signature = sign(identity["secret"], endorsing_data.get_signing_bytes())
-    endorsing_data.set_signature(identity_signature)
-    transaction = await Endorsement.build_endorsement_transaction(client, trustee["address"], endorsing_data)
-    trustee_signature = sign(trustee["secret"], transaction.get_signing_bytes())
-    transaction.set_signature(trustee_signature)
-    txn_hash = await client.submit_transaction(transaction)
-    print(' Transaction hash: ' + bytes(txn_hash).hex())
-    receipt = await client.get_receipt(txn_hash)
-    print(' Transaction receipt: ' + receipt)
+    name = secrets.token_hex(3).upper()
+    schema = Schema(did, name, "1.0.0", schema_attr_names)
+    did_transaction, schema_transaction = await asyncio.gather(
+        build_did_transaction(client, identity_signer, did),
+        build_schema_transaction(client, identity_signer, schema),
+    )
+    # Both transactions are sent by the trustee and were built against the same account nonce,
+    # so assign consecutive nonces before signing to be able to submit them together
+    schema_transaction.nonce = did_transaction.nonce + 1
+    txn_hashes = await asyncio.gather(
+        submit_transaction(client, trustee_signer, did_transaction),
+        submit_transaction(client, trustee_signer, schema_transaction),
+    )
+    receipts = await client.get_receipts(txn_hashes)
+    for txn_hash, receipt in zip(txn_hashes, receipts):
+        print(' Transaction hash: ' + txn_hash.hex())
+        print(' Transaction receipt: ' + receipt)
 
     print("3. Resolve DID Document")
     resolved_did_doc = await DidResolver.resolve_did(client, did, None)
     print(' Resolved DID Document:' + resolved_did_doc)
 
-    print("4. Publish Schema")
-    name = ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(6))
-    schema = Schema(did, name, "1.0.0", ["First Name", "Last Name"])
-    endorsing_data = await SchemaRegistry.build_create_schema_endorsing_data(client, schema)
-    identity_signature = sign(identity["secret"], endorsing_data.get_signing_bytes())
-    endorsing_data.set_signature(identity_signature)
-
-    # Author: serialize endorsement data into JSON string and pass it to trustee
-    endorsing_data_json = endorsing_data.to_string()
-    print('  Schema transaction endorsement data: ' + endorsing_data_json)
-    # Trustee: deserialize endorsement data form json
-    schema_endorsing_data = TransactionEndorsingData.from_string(endorsing_data_json)
-    transaction = await Endorsement.build_endorsement_transaction(client, trustee["address"], schema_endorsing_data)
-    trustee_signature = sign(trustee["secret"], transaction.get_signing_bytes())
-    transaction.set_signature(trustee_signature)
-    txn_hash = await client.submit_transaction(transaction)
-    print(' Transaction hash: ' + bytes(txn_hash).hex())
-    receipt = await client.get_receipt(txn_hash)
-    print(' Transaction receipt: ' + receipt)
-
-    print("5. Resolve Schema")
+    print("4. Resolve Schema")
     resolved_schema = await SchemaRegistry.resolve_schema(client, schema.id)
     print(' Resolved Schema:' + resolved_schema.to_string())
 
 
+def run(main):
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    if hasattr(uvloop, "run"):
+        return uvloop.run(main)
+    # `uvloop.run` is available since uvloop 0.18
+    uvloop.install()
+    return asyncio.run(main)
+
+
 if __name__ == "__main__":
-    asyncio.get_event_loop().run_until_complete(demo())
+    run(demo())
@@ -13,13 +13,8 @@ from .types import (
     Endorsement,
     RoleControl,
     ValidatorControl,
-    InternalError,
-    Status,
-    TransactionType,
-    VdrError,
     ContractConfig,
     ContractSpec,
-    PingStatus,
     SignatureData,
     LedgerClient,
     DidAttributeChanged,
@@ -30,9 +25,16 @@ from .types import (
     DidDelegateChanged,
     DidOwnerChanged,
     DidResolutionOptions,
-    EventQuery,
     EventLog,
 )
+from .indy_besu_vdr import (
+    InternalError,
+    Status,
+    TransactionType,
+    VdrError,
+    PingStatus,
+    EventQuery,
+)
 
 __all__ = (
     "Transaction",
@@ -1,8 +1,292 @@
+import asyncio
+import collections
+import functools
+import itertools
 import json
+import os
+import time
 import typing
+import weakref
 
 import indy_besu_vdr
-from indy_besu_vdr.indy_besu_vdr import *
+from indy_besu_vdr.indy_besu_vdr import (
+    ContractConfig,
+    ContractSpec,
+    DidAttributeChanged,
+    DidDelegateChanged,
+    DidEvents,
+    DidOwnerChanged,
+    DidResolutionOptions,
+    EventLog,
+    JsonValue,
+    QuorumConfig,
+    SignatureData,
+    VdrError,
+    build_add_validator_transaction,
+    build_assign_role_transaction,
+    build_create_credential_definition_endorsing_data,
+    build_create_credential_definition_transaction,
+    build_create_did_endorsing_data,
+    build_create_did_mapping_endorsing_data,
+    build_create_did_mapping_transaction,
+    build_create_did_transaction,
+    build_create_resource_mapping_endorsing_data,
+    build_create_resource_mapping_transaction,
+    build_create_schema_endorsing_data,
+    build_create_schema_transaction,
+    build_deactivate_did_endorsing_data,
+    build_deactivate_did_transaction,
+    build_did_add_delegate_endorsing_data,
+    build_did_add_delegate_transaction,
+    build_did_change_owner_endorsing_data,
+    build_did_change_owner_transaction,
+    build_did_revoke_attribute_endorsing_data,
+    build_did_revoke_attribute_transaction,
+    build_did_revoke_delegate_endorsing_data,
+    build_did_revoke_delegate_transaction,
+    build_did_set_attribute_endorsing_data,
+    build_did_set_attribute_transaction,
+    build_endorsement_transaction,
+    build_get_did_changed_transaction,
+    build_get_did_events_query,
+    build_get_did_mapping_transaction,
+    build_get_did_owner_transaction,
+    build_get_identity_nonce_transaction,
+    build_get_resource_mapping_transaction,
+    build_get_role_transaction,
+    build_get_validators_transaction,
+    build_has_role_transaction,
+    build_remove_validator_transaction,
+    build_resolve_credential_definition_transaction,
+    build_resolve_did_transaction,
+    build_resolve_schema_transaction,
+    build_revoke_role_transaction,
+    build_update_did_endorsing_data,
+    build_update_did_transaction,
+    credential_definition_from_string,
+    credential_definition_get_id,
+    credential_definition_to_string,
+    parse_did_attribute_changed_event_response,
+    parse_did_changed_result,
+    parse_did_delegate_changed_event_response,
+    parse_did_event_response,
+    parse_did_mapping_result,
+    parse_did_nonce_result,
+    parse_did_owner_changed_event_response,
+    parse_did_owner_result,
+    parse_get_role_result,
+    parse_get_validators_result,
+    parse_has_role_result,
+    parse_resolve_credential_definition_result,
+    parse_resolve_did_result,
+    parse_resolve_schema_result,
+    parse_resource_mapping_result,
+    resolve_credential_definition,
+    resolve_did,
+    resolve_schema,
+    schema_from_string,
+    schema_get_id,
+    schema_to_string,
+    transaction_endorsing_data_from_string,
+    transaction_endorsing_data_get_signing_bytes,
+    transaction_endorsing_data_to_string,
+    transaction_from_string,
+    transaction_get_signing_bytes,
+    transaction_to_string,
+)
+
+try:
+    import orjson
+
+    def _dumps(value) -> str:
+        # non-string keys are converted to strings as `json` does instead of being rejected
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    try:
+        import ujson
+
+        def _dumps(value) -> str:
+            return ujson.dumps(value, ensure_ascii=False, escape_forward_slashes=False)
+    except ImportError:
+        # `json.dumps` builds a new encoder on every call with non-default options, so a single one is reused
+        _dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+@functools.lru_cache(maxsize=32)
+def _read_contract_spec(spec_path: str, modified: float) -> ContractSpec:
+    # `modified` is only part of the cache key so that updated spec files are re-read
+    with open(spec_path) as f:
+        spec = json.load(f)
+    return ContractSpec(spec["contractName"], _dumps(spec["abi"]))
+
+
+def _resolve_contract_config(config: ContractConfig) -> ContractConfig:
+    if config.spec is not None or config.spec_path is None:
+        return config
+    try:
+        spec = _read_contract_spec(config.spec_path, os.stat(config.spec_path).st_mtime)
+    except (OSError, ValueError, KeyError, TypeError):
+        # let the library report the broken spec file
+        return config
+    return ContractConfig(config.address, None, spec)
+
+
+def _resolve_contract_configs(configs: typing.List[ContractConfig]) -> typing.List[ContractConfig]:
+    # specs are loaded one by one: cached specs take microseconds, while a thread pool costs more than that
+    # to start and parsing of uncached ones holds the GIL anyway
+    return [_resolve_contract_config(config) for config in configs]
+
+
+def _rewrap(cls, value):
+    # generated records are re-typed into the wrapper class by copying their fields
+    # instead of running the record constructor a second time
+    if isinstance(value, cls):
+        return value
+    wrapped = cls.__new__(cls)
+    wrapped.__dict__.update(value.__dict__)
+    return wrapped
+
+
+BytesLike = typing.Union[bytes, bytearray, memoryview]
+
+
+def _byte_view(data: BytesLike) -> BytesLike:
+    # payloads are copied into the Rust buffer byte by byte, so bytearrays and flat byte views are passed as is
+    # instead of being copied into `bytes` first. Other contiguous views are re-interpreted as bytes without a copy,
+    # non-contiguous ones cannot be and are copied
+    if isinstance(data, memoryview) and (data.ndim != 1 or data.format != "B"):
+        return data.cast("B") if data.c_contiguous else bytes(data)
+    return data
+
+
+def _copy(value):
+    # shallow copy of a record which skips the record constructor, like `_rewrap`
+    copied = value.__class__.__new__(value.__class__)
+    copied.__dict__.update(value.__dict__)
+    return copied
+
+
+def _forward(fn, init):
+    # wrappers which only re-type the result of a generated function share this implementation
+    # instead of each repeating the generated signature by hand
+    @functools.wraps(fn)
+    async def forward(*args, **kwargs):
+        return init(await fn(*args, **kwargs))
+
+    return staticmethod(forward)
+
+
+def _to_json(value: typing.Union[dict, str]) -> str:
+    # pre-serialized payloads are passed as is, so callers can serialize a payload once
+    # and reuse it for both the endorsing data and the transaction
+    if isinstance(value, str):
+        return value
+    return _dumps(value)
+
+
+def _to_json_value(value: typing.Union[dict, str]) -> str:
+    # `JsonValue` arguments are parsed by the library without error handling, so pre-serialized payloads
+    # are checked here to get an error instead of a panic
+    if isinstance(value, str):
+        try:
+            json.loads(value)
+        except ValueError as err:
+            raise VdrError.CommonInvalidData("Invalid JSON value: {}".format(err))
+        return value
+    return _dumps(value)
+
+
+class _ResolutionCache:
+    # resolved ledger objects stored per client, so clients connected to different networks never share entries.
+    # Every key can hold several variants of the object (e.g. DID Document resolved with different options),
+    # least recently used keys are evicted once `maxsize` is exceeded.
+    # Every invalidation moves the key to a new generation, so values resolved before it are not stored after it.
+    _generation_counter = itertools.count(1)
+
+    def __init__(self, maxsize: int = 10_000):
+        self._maxsize = maxsize
+        self._entries = weakref.WeakKeyDictionary()
+        # client -> [generation of keys without a recorded one, generations of recently invalidated keys]
+        self._generations = weakref.WeakKeyDictionary()
+
+    def generation(self, client: "LedgerClient", key: str) -> int:
+        generations = self._generations.get(client)
+        if generations is None:
+            return 0
+        default, known = generations
+        return known.get(key, default)
+
+    def get(self, client: "LedgerClient", key: str, ttl: typing.Optional[float], variant: typing.Hashable = None):
+        entries = self._entries.get(client)
+        if entries is None or key not in entries:
+            return None
+        entries.move_to_end(key)
+        entry = entries[key].get(variant)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if ttl is not None and time.monotonic() - stored_at >= ttl:
+            return None
+        return value
+
+    def set(self, client: "LedgerClient", key: str, value, variant: typing.Hashable = None,
+            generation: typing.Optional[int] = None):
+        if generation is not None and generation != self.generation(client, key):
+            # the key was invalidated while the value was being resolved, so the value may be outdated
+            return
+        entries = self._entries.get(client)
+        if entries is None:
+            entries = self._entries[client] = collections.OrderedDict()
+        entries.setdefault(key, {})[variant] = (time.monotonic(), value)
+        entries.move_to_end(key)
+        if len(entries) > self._maxsize:
+            entries.popitem(last=False)
+
+    def invalidate(self, client: "LedgerClient", key: str):
+        entries = self._entries.get(client)
+        if entries is not None:
+            entries.pop(key, None)
+        generations = self._generations.get(client)
+        if generations is None:
+            generations = self._generations[client] = [0, collections.OrderedDict()]
+        known = generations[1]
+        known[key] = next(self._generation_counter)
+        known.move_to_end(key)
+        if len(known) > self._maxsize:
+            # generations only grow, so keys whose generation is forgotten get one newer than any they had
+            _, generations[0] = known.popitem(last=False)
+
+
+_did_documents = _ResolutionCache()
+_schemas = _ResolutionCache()
+_credential_definitions = _ResolutionCache()
+
+
+class LedgerClient(indy_besu_vdr.indy_besu_vdr.LedgerClient):
+    def __init__(self, chain_id: int, node_address: str, contract_configs: typing.List[ContractConfig],
+                 network: typing.Optional[str], quorum_config: typing.Optional[QuorumConfig]):
+        # contract specs loaded by path are parsed once per process and shared between clients
+        contract_configs = _resolve_contract_configs(contract_configs)
+        super().__init__(chain_id, node_address, contract_configs, network, quorum_config)
+
+    async def submit_and_wait(self, transaction: "Transaction") -> str:
+        # `submit_transaction` returns once the transaction is included into a block,
+        # so its receipt is available right away
+        return await self.get_receipt(await self.submit_transaction(transaction))
+
+    async def get_receipts(self, hashes: typing.List[bytes]) -> typing.List[str]:
+        return list(await asyncio.gather(*(self.get_receipt(hash) for hash in hashes)))
+
+    async def submit_transaction(self, transaction: "Transaction") -> bytes:
+        txn_hash = await super().submit_transaction(transaction)
+        # the transaction is included into a block by now, so documents resolved from this point on are up to date
+        did = getattr(transaction, "_changed_did", None)
+        if did is not None:
+            _did_documents.invalidate(self, did)
+        return txn_hash
+
+    def invalidate_did(self, did: str):
+        _did_documents.invalidate(self, did)
 
 
 class Transaction(indy_besu_vdr.indy_besu_vdr.Transaction):
@@ -17,20 +301,11 @@ class Transaction(indy_besu_vdr.indy_besu_vdr.Transaction):
 
     @classmethod
     def from_string(cls, value: str) -> "Transaction":
-        return transaction_from_string(value)
+        return Transaction.init(transaction_from_string(value))
 
     @classmethod
     def init(cls, transaction: indy_besu_vdr.indy_besu_vdr.Transaction) -> "Transaction":
-        return Transaction(
-            transaction.type,
-            transaction._from,
-            transaction.to,
-            transaction.nonce,
-            transaction.chain_id,
-            transaction.data,
-            transaction.signature,
-            transaction.hash,
-        )
+        return _rewrap(cls, transaction)
 
 
 class TransactionEndorsingData(indy_besu_vdr.indy_besu_vdr.TransactionEndorsingData):
@@ -45,146 +320,172 @@ class TransactionEndorsingData(indy_besu_vdr.indy_besu_vdr.TransactionEndorsingD
 
     @classmethod
     def from_string(cls, value: str) -> "TransactionEndorsingData":
-        return transaction_endorsing_data_from_string(value)
+        return TransactionEndorsingData.init(transaction_endorsing_data_from_string(value))
 
     @classmethod
     def init(cls, transaction: indy_besu_vdr.indy_besu_vdr.TransactionEndorsingData) -> "TransactionEndorsingData":
-        return TransactionEndorsingData(
-            transaction.to,
-            transaction._from,
-            transaction.nonce,
-            transaction.contract,
-            transaction.method,
-            transaction.endorsing_method,
-            transaction.params,
-            transaction.signature,
-        )
+        return _rewrap(cls, transaction)
+
+
+def _changing_did(did: str, transaction):
+    # DID changed by the transaction, its cached document is dropped once the transaction is submitted
+    transaction._changed_did = did
+    return transaction
+
+
+async def _build_transactions(builds: typing.Iterable[typing.Awaitable]) -> typing.List["Transaction"]:
+    transactions = [Transaction.init(transaction) for transaction in await asyncio.gather(*builds)]
+    # transactions built concurrently for the same sender are all assigned its current account nonce,
+    # so they are made consecutive to be submittable together
+    nonces = [transaction.nonce for transaction in transactions if transaction.nonce is not None]
+    if nonces:
+        for nonce, transaction in enumerate(transactions, max(nonces)):
+            transaction.nonce = nonce
+    return transactions
 
 
 class DidIndyRegistry:
     @staticmethod
-    async def build_create_did_transaction(client: LedgerClient, _from: str, did: str, did_doc: dict) -> "Transaction":
-        return Transaction.init(await build_create_did_transaction(client, _from, did, json.dumps(did_doc)))
+    async def build_create_did_transaction(client: LedgerClient, _from: str, did: str,
+                                           did_doc: typing.Union[dict, str]) -> "Transaction":
+        return Transaction.init(await build_create_did_transaction(client, _from, did, _to_json_value(did_doc)))
+
+    @staticmethod
+    async def build_create_did_transactions(client: LedgerClient, _from: str,
+                                            items: typing.List[typing.Tuple[str, typing.Union[dict, str]]]
+                                            ) -> typing.List["Transaction"]:
+        return await _build_transactions(
+            build_create_did_transaction(client, _from, did, _to_json_value(did_doc)) for did, did_doc in items)
 
     @staticmethod
     async def build_create_did_endorsing_data(client: LedgerClient, did: str,
-                                              did_doc: dict) -> "TransactionEndorsingData":
-        return TransactionEndorsingData.init(await build_create_did_endorsing_data(client, did, json.dumps(did_doc)))
+                                              did_doc: typing.Union[dict, str]) -> "TransactionEndorsingData":
+        return TransactionEndorsingData.init(
+            await build_create_did_endorsing_data(client, did, _to_json(did_doc)))
 
     @staticmethod
-    async def build_update_did_transaction(client: LedgerClient, _from: str, did: str, did_doc: dict) -> "Transaction":
-        return Transaction.init(await build_update_did_transaction(client, _from, did, json.dumps(did_doc)))
+    async def build_update_did_transaction(client: LedgerClient, _from: str, did: str,
+                                           did_doc: typing.Union[dict, str]) -> "Transaction":
+        return _changing_did(did, Transaction.init(
+            await build_update_did_transaction(client, _from, did, _to_json(did_doc))))
 
     @staticmethod
     async def build_update_did_endorsing_data(client: LedgerClient, did: str,
-                                              did_doc: dict) -> "TransactionEndorsingData":
-        return TransactionEndorsingData.init(await build_update_did_endorsing_data(client, did, json.dumps(did_doc)))
+                                              did_doc: typing.Union[dict, str]) -> "TransactionEndorsingData":
+        return _changing_did(did, TransactionEndorsingData.init(
+            await build_update_did_endorsing_data(client, did, _to_json(did_doc))))
 
     @staticmethod
     async def build_deactivate_did_transaction(client: LedgerClient, _from: str, did: str) -> "Transaction":
-        return Transaction.init(await build_deactivate_did_transaction(client, _from, did))
+        return _changing_did(did, Transaction.init(await build_deactivate_did_transaction(client, _from, did)))
 
     @staticmethod
     async def build_deactivate_did_endorsing_data(client: LedgerClient, did: str) -> "TransactionEndorsingData":
-        return TransactionEndorsingData.init(await build_deactivate_did_endorsing_data(client, did))
+        return _changing_did(did, TransactionEndorsingData.init(
+            await build_deactivate_did_endorsing_data(client, did)))
 
-    @staticmethod
-    async def build_resolve_did_transaction(client: LedgerClient, did: str) -> "Transaction":
-        return Transaction.init(await build_resolve_did_transaction(client, did))
+    build_resolve_did_transaction = _forward(build_resolve_did_transaction, Transaction.init)
 
     @staticmethod
-    def parse_resolve_did_result(client: LedgerClient, data: bytes) -> str:
-        return parse_resolve_did_result(client, data)
+    def parse_resolve_did_result(client: LedgerClient, data: BytesLike) -> str:
+        return parse_resolve_did_result(client, _byte_view(data))
 
 
 class DidEthrRegistry:
     @staticmethod
     async def build_did_change_owner_transaction(client: LedgerClient, _from: str, did: str,
                                                  new_owner: str) -> "Transaction":
-        return Transaction.init(await build_did_change_owner_transaction(client, _from, did, new_owner))
+        return _changing_did(did, Transaction.init(
+            await build_did_change_owner_transaction(client, _from, did, new_owner)))
 
     @staticmethod
     async def build_did_change_owner_endorsing_data(client: LedgerClient, did: str,
                                                     new_owner: str) -> "TransactionEndorsingData":
-        return TransactionEndorsingData.init(await build_did_change_owner_endorsing_data(client, did, new_owner))
+        return _changing_did(did, TransactionEndorsingData.init(
+            await build_did_change_owner_endorsing_data(client, did, new_owner)))
 
     @staticmethod
     async def build_did_add_delegate_transaction(client: LedgerClient, _from: str, did: str,
                                                  delegate_type: str, delegate: str, validity: int) -> "Transaction":
-        return Transaction.init(
-            await build_did_add_delegate_transaction(client, _from, did, delegate_type, delegate, validity))
+        return _changing_did(did, Transaction.init(
+            await build_did_add_delegate_transaction(client, _from, did, delegate_type, delegate, validity)))
 
     @staticmethod
     async def build_did_add_delegate_endorsing_data(client: LedgerClient, did: str,
                                                     delegate_type: str, delegate: str,
                                                     validity: int) -> "TransactionEndorsingData":
-        return TransactionEndorsingData.init(
-            await build_did_add_delegate_endorsing_data(client, did, delegate_type, delegate, validity))
+        return _changing_did(did, TransactionEndorsingData.init(
+            await build_did_add_delegate_endorsing_data(client, did, delegate_type, delegate, validity)))
 
     @staticmethod
     async def build_did_revoke_delegate_transaction(client: LedgerClient, _from: str, did: str,
                                                     delegate_type: str, delegate: str) -> "Transaction":
-        return Transaction.init(
-            await build_did_revoke_delegate_transaction(client, _from, did, delegate_type, delegate))
+        return _changing_did(did, Transaction.init(
+            await build_did_revoke_delegate_transaction(client, _from, did, delegate_type, delegate)))
 
     @staticmethod
     async def build_did_revoke_delegate_endorsing_data(client: LedgerClient, did: str,
                                                        delegate_type: str, delegate: str) -> "TransactionEndorsingData":
-        return TransactionEndorsingData.init(
-            await build_did_revoke_delegate_endorsing_data(client, did, delegate_type, delegate))
+        return _changing_did(did, TransactionEndorsingData.init(
+            await build_did_revoke_delegate_endorsing_data(client, did, delegate_type, delegate)))
 
     @staticmethod
     async def build_did_set_attribute_transaction(client: LedgerClient, _from: str, did: str,
-                                                  attribute: str, validity: int) -> "Transaction":
-        return Transaction.init(
-            await build_did_set_attribute_transaction(client, _from, did, attribute, validity))
+                                                  attribute: typing.Union[dict, str], validity: int) -> "Transaction":
+        return _changing_did(did, Transaction.init(
+            await build_did_set_attribute_transaction(client, _from, did, _to_json(attribute), validity)))
+
+    @staticmethod
+    async def build_did_set_attribute_transactions(client: LedgerClient, _from: str,
+                                                   items: typing.List[typing.Tuple[str, typing.Union[dict, str], int]]
+                                                   ) -> typing.List["Transaction"]:
+        transactions = await _build_transactions(
+            build_did_set_attribute_transaction(client, _from, did, _to_json(attribute), validity)
+            for did, attribute, validity in items)
+        return [_changing_did(did, transaction) for transaction, (did, _, _) in zip(transactions, items)]
 
     @staticmethod
-    async def build_did_set_attribute_endorsing_data(client: LedgerClient, did: str, attribute: dict,
+    async def build_did_set_attribute_endorsing_data(client: LedgerClient, did: str,
+                                                     attribute: typing.Union[dict, str],
                                                      validity: int) -> "TransactionEndorsingData":
-        return TransactionEndorsingData.init(
-            await build_did_set_attribute_endorsing_data(client, did, json.dumps(attribute), validity))
+        return _changing_did(did, TransactionEndorsingData.init(
+            await build_did_set_attribute_endorsing_data(client, did, _to_json(attribute), validity)))
 
     @staticmethod
     async def build_did_revoke_attribute_transaction(client: LedgerClient, _from: str, did: str,
-                                                     attribute: dict) -> "Transaction":
-        return Transaction.init(
-            await build_did_revoke_attribute_transaction(client, _from, did, json.dumps(attribute)))
+                                                     attribute: typing.Union[dict, str]) -> "Transaction":
+        return _changing_did(did, Transaction.init(
+            await build_did_revoke_attribute_transaction(client, _from, did, _to_json(attribute))))
 
     @staticmethod
     async def build_did_revoke_attribute_endorsing_data(client: LedgerClient, did: str,
-                                                        attribute: str) -> "TransactionEndorsingData":
-        return TransactionEndorsingData.init(
-            await build_did_revoke_attribute_endorsing_data(client, did, attribute))
+                                                        attribute: typing.Union[dict, str]
+                                                        ) -> "TransactionEndorsingData":
+        return _changing_did(did, TransactionEndorsingData.init(
+            await build_did_revoke_attribute_endorsing_data(client, did, _to_json(attribute))))
 
-    @staticmethod
-    async def build_get_did_owner_transaction(client: LedgerClient, did: str) -> "Transaction":
-        return Transaction.init(await build_get_did_owner_transaction(client, did))
+    build_get_did_owner_transaction = _forward(build_get_did_owner_transaction, Transaction.init)
 
-    @staticmethod
-    async def build_get_did_changed_transaction(client: LedgerClient, did: str) -> "Transaction":
-        return Transaction.init(await build_get_did_changed_transaction(client, did))
+    build_get_did_changed_transaction = _forward(build_get_did_changed_transaction, Transaction.init)
 
     @staticmethod
     async def build_get_identity_nonce_transaction(client: LedgerClient, did: str) -> "Transaction":
         return Transaction.init(await build_get_identity_nonce_transaction(client, did))
 
-    @staticmethod
-    async def build_get_did_events_query(client: LedgerClient, did: str, from_block: typing.Optional[int],
-                                         to_block: typing.Optional[int]) -> "EventQuery":
-        return await build_get_did_events_query(client, did, from_block, to_block)
+    # pure pass-throughs are bound directly to skip an extra coroutine frame per call
+    build_get_did_events_query = staticmethod(build_get_did_events_query)
 
     @staticmethod
-    def parse_did_changed_result(client: LedgerClient, data: bytes) -> int:
-        return parse_did_changed_result(client, data)
+    def parse_did_changed_result(client: LedgerClient, data: BytesLike) -> int:
+        return parse_did_changed_result(client, _byte_view(data))
 
     @staticmethod
-    def parse_did_nonce_result(client: LedgerClient, data: bytes) -> int:
-        return parse_did_nonce_result(client, data)
+    def parse_did_nonce_result(client: LedgerClient, data: BytesLike) -> int:
+        return parse_did_nonce_result(client, _byte_view(data))
 
     @staticmethod
-    def parse_did_owner_result(client: LedgerClient, data: bytes) -> str:
-        return parse_did_owner_result(client, data)
+    def parse_did_owner_result(client: LedgerClient, data: BytesLike) -> str:
+        return parse_did_owner_result(client, _byte_view(data))
 
     @staticmethod
     def parse_did_attribute_changed_event_response(client: LedgerClient, data: EventLog) -> DidAttributeChanged:
@@ -204,9 +505,20 @@ class DidEthrRegistry:
 
 
 class DidResolver:
+    resolve_did = staticmethod(resolve_did)
+
     @staticmethod
-    async def resolve_did(client: LedgerClient, did: str, options: typing.Optional[DidResolutionOptions]) -> str:
-        return await resolve_did(client, did, options)
+    async def resolve_did_cached(client: LedgerClient, did: str, options: typing.Optional[DidResolutionOptions],
+                                 ttl: float = 30.0) -> str:
+        # DID Document may be changed on the ledger, so the returned document can be up to `ttl` seconds stale.
+        # Documents changed through the builders of this module are dropped from the cache once submitted.
+        variant = (options.accept, options.block_tag) if options is not None else None
+        did_doc = _did_documents.get(client, did, ttl, variant)
+        if did_doc is None:
+            generation = _did_documents.generation(client, did)
+            did_doc = await resolve_did(client, did, options)
+            _did_documents.set(client, did, did_doc, variant, generation)
+        return did_doc
 
 
 class Schema(indy_besu_vdr.indy_besu_vdr.Schema):
@@ -215,16 +527,16 @@ class Schema(indy_besu_vdr.indy_besu_vdr.Schema):
 
     @property
     def id(self) -> str:
-        return schema_get_id(self)
+        # id depends only on the issuer, name and version, so it is recomputed only when one of them changes
+        key = (self.issuer_id, self.name, self.version)
+        cached = getattr(self, "_id", None)
+        if cached is None or cached[0] != key:
+            cached = self._id = (key, schema_get_id(self))
+        return cached[1]
 
     @classmethod
     def init(cls, schema: indy_besu_vdr.indy_besu_vdr.Schema) -> "Schema":
-        return Schema(
-            schema.issuer_id,
-            schema.name,
-            schema.version,
-            schema.attr_names,
-        )
+        return _rewrap(cls, schema)
 
     def to_string(self) -> str:
         return schema_to_string(self)
@@ -236,24 +548,38 @@ class Schema(indy_besu_vdr.indy_besu_vdr.Schema):
 
 class SchemaRegistry:
     @staticmethod
-    async def build_create_schema_transaction(client: LedgerClient, _from: str, schema: dict) -> "Transaction":
-        return Transaction.init(await build_create_schema_transaction(client, _from, json.dumps(schema)))
+    async def build_create_schema_transaction(client: LedgerClient, _from: str,
+                                              schema: typing.Union[dict, str]) -> "Transaction":
+        return Transaction.init(await build_create_schema_transaction(client, _from, _to_json(schema)))
 
     @staticmethod
-    async def build_create_schema_endorsing_data(client: LedgerClient, schema: Schema) -> "TransactionEndorsingData":
-        return TransactionEndorsingData.init(await build_create_schema_endorsing_data(client, schema))
+    async def build_create_schema_transactions(client: LedgerClient, _from: str,
+                                               schemas: typing.List[typing.Union[dict, str]]
+                                               ) -> typing.List["Transaction"]:
+        return await _build_transactions(
+            build_create_schema_transaction(client, _from, _to_json(schema)) for schema in schemas)
 
-    @staticmethod
-    async def build_resolve_schema_transaction(client: LedgerClient, id: str) -> "Transaction":
-        return Transaction.init(await build_resolve_schema_transaction(client, id))
+    build_create_schema_endorsing_data = _forward(build_create_schema_endorsing_data, TransactionEndorsingData.init)
+
+    build_resolve_schema_transaction = _forward(build_resolve_schema_transaction, Transaction.init)
 
     @staticmethod
-    def parse_resolve_schema_result(client: LedgerClient, data: bytes) -> str:
-        return parse_resolve_schema_result(client, data)
+    def parse_resolve_schema_result(client: LedgerClient, data: BytesLike) -> str:
+        return parse_resolve_schema_result(client, _byte_view(data))
+
+    resolve_schema = _forward(resolve_schema, Schema.init)
 
     @staticmethod
-    async def resolve_schema(client: LedgerClient, id: str) -> Schema:
-        return Schema.init(await resolve_schema(client, id))
+    async def resolve_schema_cached(client: LedgerClient, id: str) -> Schema:
+        # Schema cannot be changed once published, so it is cached without expiration
+        schema = _schemas.get(client, id, None)
+        if schema is None:
+            schema = await SchemaRegistry.resolve_schema(client, id)
+            _schemas.set(client, id, schema)
+        # every caller gets its own copy, so changes made to it do not leak into the cache
+        schema = _copy(schema)
+        schema.attr_names = list(schema.attr_names)
+        return schema
 
 
 class CredentialDefinition(indy_besu_vdr.indy_besu_vdr.CredentialDefinition):
@@ -262,17 +588,16 @@ class CredentialDefinition(indy_besu_vdr.indy_besu_vdr.CredentialDefinition):
 
     @property
     def id(self) -> str:
-        return credential_definition_get_id(self)
+        # id depends only on the issuer, schema and tag, so it is recomputed only when one of them changes
+        key = (self.issuer_id, self.schema_id, self.tag)
+        cached = getattr(self, "_id", None)
+        if cached is None or cached[0] != key:
+            cached = self._id = (key, credential_definition_get_id(self))
+        return cached[1]
 
     @classmethod
     def init(cls, cred_def: indy_besu_vdr.indy_besu_vdr.CredentialDefinition) -> "CredentialDefinition":
-        return CredentialDefinition(
-            cred_def.issuer_id,
-            cred_def.schema_id,
-            cred_def.cred_def_type,
-            cred_def.tag,
-            cred_def.value,
-        )
+        return _rewrap(cls, cred_def)
 
     def to_string(self) -> str:
         return credential_definition_to_string(self)
@@ -285,129 +610,104 @@ class CredentialDefinition(indy_besu_vdr.indy_besu_vdr.CredentialDefinition):
 class CredentialDefinitionRegistry:
     @staticmethod
     async def build_create_credential_definition_transaction(client: LedgerClient, _from: str,
-                                                             credential_definition: dict) -> "Transaction":
+                                                             credential_definition: CredentialDefinition
+                                                             ) -> "Transaction":
         return Transaction.init(
-            await build_create_credential_definition_transaction(client, _from, json.dumps(credential_definition)))
+            await build_create_credential_definition_transaction(client, _from, credential_definition))
+
+    @staticmethod
+    async def build_create_credential_definition_transactions(
+            client: LedgerClient, _from: str,
+            credential_definitions: typing.List[CredentialDefinition]) -> typing.List["Transaction"]:
+        return await _build_transactions(
+            build_create_credential_definition_transaction(client, _from, credential_definition)
+            for credential_definition in credential_definitions)
 
     @staticmethod
     async def build_create_credential_definition_endorsing_data(client: LedgerClient,
-                                                                credential_definition: dict) -> "TransactionEndorsingData":
+                                                                credential_definition: typing.Union[dict, str]
+                                                                ) -> "TransactionEndorsingData":
         return TransactionEndorsingData.init(
-            await build_create_credential_definition_endorsing_data(client, json.dumps(credential_definition)))
+            await build_create_credential_definition_endorsing_data(client, _to_json(credential_definition)))
 
-    @staticmethod
-    async def build_resolve_credential_definition_transaction(client: LedgerClient, id: str) -> "Transaction":
-        return Transaction(await build_resolve_credential_definition_transaction(client, id))
+    build_resolve_credential_definition_transaction = _forward(
+        build_resolve_credential_definition_transaction, Transaction.init)
 
     @staticmethod
-    def parse_resolve_credential_definition_result(client: LedgerClient, data: bytes) -> str:
-        return parse_resolve_credential_definition_result(client, data)
+    def parse_resolve_credential_definition_result(client: LedgerClient, data: BytesLike) -> str:
+        return parse_resolve_credential_definition_result(client, _byte_view(data))
+
+    resolve_credential_definition = _forward(resolve_credential_definition, CredentialDefinition.init)
 
     @staticmethod
-    async def resolve_credential_definition(client: LedgerClient, id: str) -> str:
-        return await resolve_credential_definition(client, id)
+    async def resolve_credential_definition_cached(client: LedgerClient, id: str) -> CredentialDefinition:
+        # Credential Definition cannot be changed once published, so it is cached without expiration
+        cred_def = _credential_definitions.get(client, id, None)
+        if cred_def is None:
+            cred_def = await CredentialDefinitionRegistry.resolve_credential_definition(client, id)
+            _credential_definitions.set(client, id, cred_def)
+        # every caller gets its own copy, so changes made to it do not leak into the cache
+        return _copy(cred_def)
 
 
 class LegacyMapping:
-    @staticmethod
-    async def build_create_did_mapping_transaction(client: LedgerClient, _from: str, did: str, legacy_identifier: str,
-                                                   legacy_verkey: str, ed25519_signature: bytes) -> "Transaction":
-        return Transaction.init(
-            await build_create_did_mapping_transaction(client, _from, did, legacy_identifier, legacy_verkey,
-                                                       ed25519_signature))
+    build_create_did_mapping_transaction = _forward(build_create_did_mapping_transaction, Transaction.init)
 
-    @staticmethod
-    async def build_create_did_mapping_endorsing_data(client: LedgerClient, did: str, legacy_identifier: str,
-                                                      legacy_verkey: str,
-                                                      ed25519_signature: bytes) -> "TransactionEndorsingData":
-        return TransactionEndorsingData.init(
-            await build_create_did_mapping_endorsing_data(client, did, legacy_identifier, legacy_verkey,
-                                                          ed25519_signature))
+    build_create_did_mapping_endorsing_data = _forward(
+        build_create_did_mapping_endorsing_data, TransactionEndorsingData.init)
 
-    @staticmethod
-    async def build_get_did_mapping_transaction(client: LedgerClient, legacy_identifier: str) -> "Transaction":
-        return Transaction.init(await build_get_did_mapping_transaction(client, legacy_identifier))
+    build_get_did_mapping_transaction = _forward(build_get_did_mapping_transaction, Transaction.init)
 
     @staticmethod
-    def parse_did_mapping_result(client: LedgerClient, data: bytes) -> str:
-        return parse_did_mapping_result(client, data)
+    def parse_did_mapping_result(client: LedgerClient, data: BytesLike) -> str:
+        return parse_did_mapping_result(client, _byte_view(data))
 
-    @staticmethod
-    async def build_create_resource_mapping_transaction(client: LedgerClient, _from: str, did: str,
-                                                        legacy_issuer_identifier: str, legacy_identifier: str,
-                                                        new_identifier: str) -> "Transaction":
-        return Transaction.init(
-            await build_create_resource_mapping_transaction(client, _from, did, legacy_issuer_identifier,
-                                                            legacy_identifier,
-                                                            new_identifier))
+    build_create_resource_mapping_transaction = _forward(build_create_resource_mapping_transaction, Transaction.init)
 
-    @staticmethod
-    async def build_create_resource_mapping_endorsing_data(client: LedgerClient, did: str,
-                                                           legacy_issuer_identifier: str, legacy_identifier: str,
-                                                           new_identifier: str) -> "TransactionEndorsingData":
-        return TransactionEndorsingData.init(
-            await build_create_resource_mapping_endorsing_data(client, did, legacy_issuer_identifier, legacy_identifier,
-                                                               new_identifier))
+    build_create_resource_mapping_endorsing_data = _forward(
+        build_create_resource_mapping_endorsing_data, TransactionEndorsingData.init)
 
-    @staticmethod
-    async def build_get_resource_mapping_transaction(client: LedgerClient, legacy_identifier: str) -> "Transaction":
-        return Transaction.init(await build_get_resource_mapping_transaction(client, legacy_identifier))
+    build_get_resource_mapping_transaction = _forward(build_get_resource_mapping_transaction, Transaction.init)
 
     @staticmethod
-    def parse_resource_mapping_result(client: LedgerClient, data: bytes) -> str:
-        return parse_resource_mapping_result(client, data)
+    def parse_resource_mapping_result(client: LedgerClient, data: BytesLike) -> str:
+        return parse_resource_mapping_result(client, _byte_view(data))
 
 
 class Endorsement:
     @staticmethod
     async def build_endorsement_transaction(client: LedgerClient, _from: str,
                                             endorsement_data: "TransactionEndorsingData") -> "Transaction":
-        return Transaction.init(await build_endorsement_transaction(client, _from, endorsement_data))
+        transaction = Transaction.init(await build_endorsement_transaction(client, _from, endorsement_data))
+        did = getattr(endorsement_data, "_changed_did", None)
+        return _changing_did(did, transaction) if did is not None else transaction
 
 
 class RoleControl:
-    @staticmethod
-    async def build_assign_role_transaction(client: LedgerClient, _from: str,
-                                            role: int, account: str) -> "Transaction":
-        return Transaction.init(await build_assign_role_transaction(client, _from, role, account))
+    build_assign_role_transaction = _forward(build_assign_role_transaction, Transaction.init)
 
-    @staticmethod
-    async def build_revoke_role_transaction(client: LedgerClient, _from: str,
-                                            role: int, account: str) -> "Transaction":
-        return Transaction.init(await build_revoke_role_transaction(client, _from, role, account))
+    build_revoke_role_transaction = _forward(build_revoke_role_transaction, Transaction.init)
 
-    @staticmethod
-    async def build_has_role_transaction(client: LedgerClient, role: int, account: str) -> "Transaction":
-        return Transaction.init(await build_has_role_transaction(client, role, account))
+    build_has_role_transaction = _forward(build_has_role_transaction, Transaction.init)
 
-    @staticmethod
-    async def build_get_role_transaction(client: LedgerClient, account: str) -> "Transaction":
-        return Transaction.init(await build_get_role_transaction(client, account))
+    build_get_role_transaction = _forward(build_get_role_transaction, Transaction.init)
 
     @staticmethod
-    def parse_has_role_result(client: LedgerClient, data: bytes) -> bool:
-        return parse_has_role_result(client, data)
+    def parse_has_role_result(client: LedgerClient, data: BytesLike) -> bool:
+        return parse_has_role_result(client, _byte_view(data))
 
     @staticmethod
-    def parse_get_role_result(client: LedgerClient, data: bytes) -> int:
-        return parse_get_role_result(client, data)
+    def parse_get_role_result(client: LedgerClient, data: BytesLike) -> int:
+        return parse_get_role_result(client, _byte_view(data))
 
 
 class ValidatorControl:
-    @staticmethod
-    async def build_add_validator_transaction(client: LedgerClient, _from: str,
-                                              validator_address: str) -> "Transaction":
-        return Transaction.init(await build_add_validator_transaction(client, _from, validator_address))
+    build_add_validator_transaction = _forward(build_add_validator_transaction, Transaction.init)
 
-    @staticmethod
-    async def build_remove_validator_transaction(client: LedgerClient, _from: str,
-                                                 validator_address: str) -> "Transaction":
-        return Transaction.init(await build_remove_validator_transaction(client, _from, validator_address))
+    build_remove_validator_transaction = _forward(build_remove_validator_transaction, Transaction.init)
 
-    @staticmethod
-    async def build_get_validators_transaction(client: LedgerClient) -> "Transaction":
-        return Transaction.init(await build_get_validators_transaction(client))
+    build_get_validators_transaction = _forward(build_get_validators_transaction, Transaction.init)
 
     @staticmethod
-    def parse_get_validators_result(client: LedgerClient) -> str:
-        return parse_get_validators_result(client)
+    def parse_get_validators_result(client: LedgerClient, data: BytesLike) -> str:
+        return parse_get_validators_result(client, _byte_view(data))
@@ -1,17 +1,67 @@
 """Module setup."""
 
 import os
-import runpy
+import re
+import sys
 from setuptools import find_packages, setup
+from setuptools.dist import Distribution
+
+try:
+    from setuptools.command.bdist_wheel import bdist_wheel
+except ImportError:
+    try:
+        from wheel.bdist_wheel import bdist_wheel
+    except ImportError:
+        bdist_wheel = None
 
 PACKAGE_NAME = "indy_besu_vdr"
-version_meta = runpy.run_path("./{}/version.py".format(PACKAGE_NAME))
-VERSION = version_meta["__version__"]
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+with open(os.path.join(ROOT, PACKAGE_NAME, "version.py"), "r") as fh:
+    VERSION = re.search(r"^__version__ = [\"']([^\"']+)[\"']", fh.read(), re.M).group(1)
+
+# Only the library for the platform the package is built on is bundled
+if sys.platform == "darwin":
+    LIBRARY = "libindy_besu_vdr_uniffi.dylib"
+elif sys.platform.startswith("win"):
+    LIBRARY = "indy_besu_vdr_uniffi.dll"
+else:
+    LIBRARY = "libindy_besu_vdr_uniffi.so"
+
+
+class BinaryDistribution(Distribution):
+    """Distribution which always produces a platform specific wheel."""
+
+    def has_ext_modules(self):
+        return True
+
+
+CMDCLASS = {}
+
+if bdist_wheel is not None:
+
+    class PlatformWheel(bdist_wheel):
+        """Wheel tagged for the build platform only.
+
+        The library is loaded with ctypes, so the wheel does not depend on the
+        Python version or ABI and a single `py3-none-<platform>` wheel serves all of them.
+        """
+
+        def finalize_options(self):
+            super().finalize_options()
+            self.root_is_pure = False
+
+        def get_tag(self):
+            _, _, plat = super().get_tag()
+            return "py3", "none", plat
+
+    CMDCLASS["bdist_wheel"] = PlatformWheel
 
-with open(os.path.abspath("./README.md"), "r") as fh:
-    long_description = fh.read()
 
 if __name__ == "__main__":
+    with open(os.path.join(ROOT, "README.md"), "r") as fh:
+        long_description = fh.read()
+
     setup(
         name=PACKAGE_NAME,
         version=VERSION,
@@ -21,13 +71,11 @@ if __name__ == "__main__":
         long_description_content_type="text/markdown",
         packages=find_packages(),
         include_package_data=True,
-        package_data={
-            "": [
-                "indy_besu_vdr_uniffi.dll",
-                "libindy_besu_vdr_uniffi.dylib",
-                "libindy_besu_vdr_uniffi.so",
-            ]
-        },
+        zip_safe=False,
+        package_data={"": [LIBRARY]},
+        distclass=BinaryDistribution,
+        cmdclass=CMDCLASS,
+        extras_require={"fast-json": ["orjson"]},
         python_requires=">=3.6.3",
         classifiers=[
             "Programming Language :: Python :: 3",